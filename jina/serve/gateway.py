@@ -1,11 +1,13 @@
 import abc
+import copy
+import functools
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, Dict, Optional
 
+from jina.helper import random_port
 from jina.jaml import JAMLCompatible
 from jina.logging.logger import JinaLogger
 from jina.serve.helper import store_init_kwargs, wrap_func
-from jina.serve.runtimes.gateway.request_handling import GatewayRequestHandler
 
 if TYPE_CHECKING:
     from jina.serve.runtimes.gateway.streamer import GatewayStreamer
@@ -13,6 +15,15 @@ if TYPE_CHECKING:
 __all__ = ['BaseGateway']
 
 
+@functools.lru_cache()
+def _get_default_runtime_args() -> Dict:
+    from jina.parsers import set_gateway_runtime_args_parser
+
+    parser = set_gateway_runtime_args_parser()
+    default_args = parser.parse_args([])
+    return dict(vars(default_args))
+
+
 class GatewayType(type(JAMLCompatible), type):
     """The class of Gateway type, which is the metaclass of :class:`BaseGateway`."""
 
@@ -71,6 +82,8 @@ class BaseGateway(JAMLCompatible, metaclass=GatewayType):
         :param streamer: GatewayStreamer object to be set if not None
         :param kwargs: additional extra keyword arguments to avoid failing when extra params ara passed that are not expected
         """
+        from jina.serve.runtimes.gateway.request_handling import GatewayRequestHandler
+
         self._add_runtime_args(runtime_args)
         self.name = name
         self.logger = JinaLogger(self.name, **vars(self.runtime_args))
@@ -79,7 +92,6 @@ class BaseGateway(JAMLCompatible, metaclass=GatewayType):
         self.grpc_tracing_server_interceptors = (
             self.runtime_args.grpc_tracing_server_interceptors
         )
-        self.logger = JinaLogger(self.name, **vars(self.runtime_args))
         self._request_handler = GatewayRequestHandler(
             args=self.runtime_args, logger=self.logger, streamer=streamer
         )
@@ -87,11 +99,9 @@ class BaseGateway(JAMLCompatible, metaclass=GatewayType):
         self.executor = self._request_handler.executor  # backward compatibility
 
     def _add_runtime_args(self, _runtime_args: Optional[Dict]):
-        from jina.parsers import set_gateway_runtime_args_parser
-
-        parser = set_gateway_runtime_args_parser()
-        default_args = parser.parse_args([])
-        default_args_dict = dict(vars(default_args))
+        # argparse defaults are only built once, but the random monitoring port must be drawn for each Gateway
+        default_args_dict = copy.deepcopy(_get_default_runtime_args())
+        default_args_dict['port_monitoring'] = [random_port()]
         _runtime_args = _runtime_args or {}
         runtime_set_args = {
             'tracer_provider': None,
@@ -1,21 +1,30 @@
 import argparse
 import asyncio
+import functools
 import signal
 import threading
 import time
+import uuid
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Optional, Union
 
 from grpc import RpcError
 
 from jina.constants import __windows__
-from jina.helper import send_telemetry_event
+from jina.helper import _update_policy, cached_property, send_telemetry_event
 from jina.serve.instrumentation import InstrumentationMixin
 from jina.serve.networking.utils import send_health_check_async, send_health_check_sync
 from jina.serve.runtimes.base import BaseRuntime
 from jina.serve.runtimes.monitoring import MonitoringMixin
 from jina.types.request.data import DataRequest
 
+try:
+    from grpc_health.v1 import health_pb2
+
+    _SERVING = health_pb2.HealthCheckResponse.ServingStatus.SERVING
+except ImportError:  # pragma: no cover
+    _SERVING = None
+
 if TYPE_CHECKING:  # pragma: no cover
     import multiprocessing
 
@@ -26,6 +35,11 @@ HANDLED_SIGNALS = (
 )
 
 
+def _cancel_on_signal(runtime: 'AsyncNewLoopRuntime', signum, frame):
+    runtime.logger.debug(f'Received signal {signal.Signals(signum).name}')
+    runtime.is_cancel.set()
+
+
 class AsyncNewLoopRuntime(BaseRuntime, MonitoringMixin, InstrumentationMixin, ABC):
     """
     The async runtime to start a new event loop.
@@ -40,29 +54,18 @@ class AsyncNewLoopRuntime(BaseRuntime, MonitoringMixin, InstrumentationMixin, AB
         **kwargs,
     ):
         super().__init__(args, **kwargs)
+        _update_policy()
         self._loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self._loop)
         self.is_cancel = cancel_event or asyncio.Event()
 
+        signal_handler = functools.partial(_cancel_on_signal, self)
         if not __windows__:
-
-            def _cancel(sig):
-                def _inner_cancel(*args, **kwargs):
-                    self.logger.debug(f'Received signal {sig.name}')
-                    self.is_cancel.set(),
-
-                return _inner_cancel
-
             for sig in HANDLED_SIGNALS:
-                self._loop.add_signal_handler(sig, _cancel(sig), sig, None)
+                self._loop.add_signal_handler(sig, signal_handler, sig, None)
         else:
-
-            def _cancel(signum, frame):
-                self.logger.debug(f'Received signal {signum}')
-                self.is_cancel.set(),
-
             for sig in HANDLED_SIGNALS:
-                signal.signal(sig, _cancel)
+                signal.signal(sig, signal_handler)
 
         self._setup_monitoring()
         self._setup_instrumentation(
@@ -127,11 +130,44 @@ class AsyncNewLoopRuntime(BaseRuntime, MonitoringMixin, InstrumentationMixin, AB
         if isinstance(self.is_cancel, asyncio.Event):
             await self.is_cancel.wait()
         else:
-            while not self.is_cancel.is_set():
-                await asyncio.sleep(0.1)
+            await self._wait_for_sync_event(self.is_cancel)
 
         await self.async_cancel()
 
+    async def _wait_for_sync_event(
+        self, event: Union['multiprocessing.Event', 'threading.Event']
+    ):
+        """
+        Wait for a threading or multiprocessing Event without polling it from the event loop.
+
+        The blocking `wait` runs in a daemon thread which wakes up the loop once the event is set.
+        The thread ends as well when the waiting coroutine is cancelled or the loop is closed.
+
+        :param event: the threading or multiprocessing Event to wait for
+        """
+        loop = asyncio.get_running_loop()
+        async_event = asyncio.Event()
+        stop_waiting = threading.Event()
+
+        def _wait():
+            # only this thread wakes up periodically, to find out if anyone is still waiting
+            while not event.wait(timeout=1.0):
+                if stop_waiting.is_set() or loop.is_closed():
+                    return
+            if stop_waiting.is_set():
+                return
+            try:
+                loop.call_soon_threadsafe(async_event.set)
+            except RuntimeError:
+                # the loop has already been closed, nobody is waiting anymore
+                pass
+
+        threading.Thread(target=_wait, daemon=True).start()
+        try:
+            await async_event.wait()
+        finally:
+            stop_waiting.set()
+
     async def _loop_body(self):
         """Do NOT override this method when inheriting from :class:`GatewayPod`"""
         try:
@@ -192,12 +228,8 @@ class AsyncNewLoopRuntime(BaseRuntime, MonitoringMixin, InstrumentationMixin, AB
         :return: True if status is ready else False.
         """
         try:
-            from grpc_health.v1 import health_pb2, health_pb2_grpc
-
             response = send_health_check_sync(ctrl_address, timeout=timeout)
-            return (
-                response.status == health_pb2.HealthCheckResponse.ServingStatus.SERVING
-            )
+            return response.status == _SERVING
         except RpcError:
             return False
 
@@ -211,12 +243,8 @@ class AsyncNewLoopRuntime(BaseRuntime, MonitoringMixin, InstrumentationMixin, AB
         :return: True if status is ready else False.
         """
         try:
-            from grpc_health.v1 import health_pb2, health_pb2_grpc
-
             response = await send_health_check_async(ctrl_address, timeout=timeout)
-            return (
-                response.status == health_pb2.HealthCheckResponse.ServingStatus.SERVING
-            )
+            return response.status == _SERVING
         except RpcError:
             return False
 
@@ -239,21 +267,25 @@ class AsyncNewLoopRuntime(BaseRuntime, MonitoringMixin, InstrumentationMixin, AB
         :param kwargs: extra keyword arguments
         :return: True if is ready or it needs to be shutdown
         """
-        timeout_ns = 1000000000 * timeout if timeout else None
-        now = time.time_ns()
+        deadline = time.monotonic() + timeout if timeout else None
         if health_check:
             return cls.is_ready(ctrl_address, timeout)
-        while timeout_ns is None or time.time_ns() - now < timeout_ns:
+        # back off exponentially so fast starting runtimes are detected early and slow ones are not hammered
+        delay = 0.01
+        while True:
             if ready_or_shutdown_event.is_set() or cls.is_ready(ctrl_address, **kwargs):
                 return True
-            time.sleep(0.1)
-        return False
+            wait_time = delay
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait_time = min(remaining, delay)
+            # wakes up as soon as the event is set instead of sleeping through the interval
+            if ready_or_shutdown_event.wait(timeout=wait_time):
+                return True
+            delay = min(delay * 2, 0.2)
 
-    @property
+    @cached_property
     def _entity_id(self):
-        import uuid
-
-        if hasattr(self, '_entity_id_'):
-            return self._entity_id_
-        self._entity_id_ = uuid.uuid1().hex
-        return self._entity_id_
+        return uuid.uuid1().hex
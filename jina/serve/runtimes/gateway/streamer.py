@@ -1,11 +1,15 @@
 import asyncio
+import atexit
 import json
 import os
+import sys
 import threading
+from itertools import chain
 from typing import (
     TYPE_CHECKING,
     AsyncIterator,
     Dict,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -15,17 +19,20 @@ from typing import (
 
 from jina._docarray import DocumentArray
 from jina.excepts import ExecutorError
+from jina.helper import random_identity
 from jina.logging.logger import JinaLogger
 from jina.proto import jina_pb2
 from jina.serve.networking import GrpcConnectionPool
-from jina.serve.runtimes.gateway.graph.topology_graph import TopologyGraph
-from jina.serve.runtimes.gateway.async_request_response_handling import AsyncRequestResponseHandler
-from jina.serve.stream import RequestStreamer
 from jina.types.request import Request
 from jina.types.request.data import DataRequest
 
 __all__ = ['GatewayStreamer']
 
+_ERROR_CODE = jina_pb2.StatusProto.ERROR
+
+# streamers handed out by `GatewayStreamer.get_streamer`, keyed by the `JINA_STREAMER_ARGS` they were built from
+_STREAMER_CACHE: Dict[str, 'GatewayStreamer'] = {}
+
 if TYPE_CHECKING:  # pragma: no cover
     from grpc.aio._interceptor import ClientInterceptor
     from opentelemetry.instrumentation.grpc._client import (
@@ -35,6 +42,33 @@ if TYPE_CHECKING:  # pragma: no cover
     from prometheus_client import CollectorRegistry
 
 
+def _req_generator(
+    docs: DocumentArray,
+    request_size: int,
+    request_template: jina_pb2.DataRequestProto,
+) -> Iterator[DataRequest]:
+    for docs_batch in docs.batch(batch_size=request_size, shuffle=False):
+        req_proto = jina_pb2.DataRequestProto()
+        req_proto.CopyFrom(request_template)
+        req_proto.header.request_id = random_identity()
+        req = DataRequest(req_proto)
+        req.data.docs = docs_batch
+        yield req
+
+
+def _close_cached_streamers():
+    for streamer in _STREAMER_CACHE.values():
+        try:
+            # the loop that served the streamer is gone by now, so only the channels are closed
+            asyncio.run(streamer._connection_pool.close())
+        except Exception:
+            pass
+    _STREAMER_CACHE.clear()
+
+
+atexit.register(_close_cached_streamers)
+
+
 class GatewayStreamer:
     """
     Wrapper object to be used in a Custom Gateway. Naming to be defined
@@ -78,6 +112,12 @@ class GatewayStreamer:
         :param aio_tracing_client_interceptors: Optional list of aio grpc tracing server interceptors.
         :param tracing_client_interceptor: Optional gprc tracing server interceptor.
         """
+        from jina.serve.runtimes.gateway.async_request_response_handling import (
+            AsyncRequestResponseHandler,
+        )
+        from jina.serve.runtimes.gateway.graph.topology_graph import TopologyGraph
+        from jina.serve.stream import RequestStreamer
+
         self.logger = logger or JinaLogger(self.__class__.__name__)
         topology_graph = TopologyGraph(
             graph_representation=graph_representation,
@@ -187,7 +227,7 @@ class GatewayStreamer:
             results_in_order=results_in_order,
         ):
             error = None
-            if jina_pb2.StatusProto.ERROR == result.status.code:
+            if result.status.code == _ERROR_CODE:
                 exception = result.status.exception
                 error = ExecutorError(
                     name=exception.name,
@@ -223,22 +263,18 @@ class GatewayStreamer:
         :param results_in_order: return the results in the same order as the request_iterator
         :yield: Yields DocumentArrays or Responses from the Executors
         """
-        from jina.types.request.data import DataRequest
-
-        def _req_generator():
-            for docs_batch in docs.batch(batch_size=request_size, shuffle=False):
-                req = DataRequest()
-                req.data.docs = docs_batch
-                if exec_endpoint:
-                    req.header.exec_endpoint = exec_endpoint
-                if target_executor:
-                    req.header.target_executor = target_executor
-                if parameters:
-                    req.parameters = parameters
-                yield req
+        # header and parameters are the same for every request, set them once and copy them in each batch
+        request_template = jina_pb2.DataRequestProto()
+        if exec_endpoint:
+            request_template.header.exec_endpoint = exec_endpoint
+        if target_executor:
+            request_template.header.target_executor = target_executor
+        if parameters:
+            request_template.parameters.update(parameters)
 
         async for resp in self.rpc_stream(
-            request_iterator=_req_generator(), results_in_order=results_in_order
+            request_iterator=_req_generator(docs, request_size, request_template),
+            results_in_order=results_in_order,
         ):
             if return_results:
                 yield resp
@@ -272,12 +308,18 @@ class GatewayStreamer:
         If this method is used outside a Jina context (process not controlled/orchestrated by jina), this method will
         raise an error.
         The streamer object does not have tracing/instrumentation capabilities.
+        Streamers are shared per process, so repeated calls with the same arguments reuse the same gRPC channels.
 
         :return: Returns an instance of `GatewayStreamer`
         """
         if 'JINA_STREAMER_ARGS' in os.environ:
-            args_dict = json.loads(os.environ['JINA_STREAMER_ARGS'])
-            return GatewayStreamer(**args_dict)
+            streamer_args = os.environ['JINA_STREAMER_ARGS']
+            streamer = _STREAMER_CACHE.get(streamer_args)
+            if streamer is None:
+                args_dict = json.loads(streamer_args)
+                streamer = GatewayStreamer(**args_dict)
+                _STREAMER_CACHE[streamer_args] = streamer
+            return streamer
         else:
             raise OSError('JINA_STREAMER_ARGS environment variable is not set')
 
@@ -292,26 +334,35 @@ class GatewayStreamer:
         :param stop_event: signal to indicate if an early termination of the task is required for graceful teardown.
         """
         self.logger.debug(f'Running GatewayRuntime warmup')
-        deployments = {key for key in self._executor_addresses.keys()}
+        deployments = self._executor_addresses
 
+        warmup = self._connection_pool.warmup
         try:
-            deployment_warmup_tasks = []
-            try:
-                for deployment in deployments:
-                    deployment_warmup_tasks.append(
-                        asyncio.create_task(
-                            self._connection_pool.warmup(
-                                deployment=deployment, stop_event=stop_event
+            if sys.version_info >= (3, 11):
+                # the TaskGroup cancels all the warmup tasks if this task is cancelled
+                async with asyncio.TaskGroup() as task_group:
+                    for deployment in deployments:
+                        task_group.create_task(
+                            warmup(deployment=deployment, stop_event=stop_event)
+                        )
+            else:
+                deployment_warmup_tasks = []
+                try:
+                    for deployment in deployments:
+                        deployment_warmup_tasks.append(
+                            asyncio.create_task(
+                                warmup(deployment=deployment, stop_event=stop_event)
                             )
                         )
-                    )
 
-                await asyncio.gather(*deployment_warmup_tasks, return_exceptions=True)
-            except asyncio.CancelledError:
-                if deployment_warmup_tasks:
-                    for task in deployment_warmup_tasks:
-                        task.cancel()
-                raise
+                    await asyncio.gather(
+                        *deployment_warmup_tasks, return_exceptions=True
+                    )
+                except asyncio.CancelledError:
+                    if deployment_warmup_tasks:
+                        for task in deployment_warmup_tasks:
+                            task.cancel()
+                    raise
         except Exception as ex:
             self.logger.error(f'error with GatewayRuntime warmup up task: {ex}')
             return
@@ -330,26 +381,24 @@ class _ExecutorStreamer:
         parameters: Optional[Dict] = None,
         **kwargs,
     ):
-        reqs = []
+        # every batch is its own request: sending a list of requests in one call would make the Executor merge them
+        # into a single request, so the send tasks are submitted as soon as each request is built and awaited at once
+        tasks = []
         for docs_batch in inputs.batch(batch_size=request_size, shuffle=False):
             req = DataRequest()
             req.header.exec_endpoint = on
             req.header.target_executor = self.executor_name
             req.parameters = parameters
             req.data.docs = docs_batch
-            reqs.append(req)
-
-        tasks = [
-            self._connection_pool.send_requests_once(
-                requests=[req], deployment=self.executor_name, head=True, endpoint=on
+            tasks.append(
+                self._connection_pool.send_requests_once(
+                    requests=[req],
+                    deployment=self.executor_name,
+                    head=True,
+                    endpoint=on,
+                )
             )
-            for req in reqs
-        ]
 
         results = await asyncio.gather(*tasks)
 
-        docs = DocumentArray.empty()
-        for resp, _ in results:
-            docs.extend(resp.docs)
-
-        return docs
+        return DocumentArray(chain.from_iterable(resp.docs for resp, _ in results))
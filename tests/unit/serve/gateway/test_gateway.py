@@ -257,3 +257,10 @@ def test_stream_individual_executor_multirequest(n_replicas: int, n_shards: int)
         assert set(r.json()['result']) == set([f'meow {i} Second(parameters={str(PARAMETERS)})' for i in range(N_DOCS)])
         # Make sure we are sending to all replicas and shards
         assert len(r.json()['pids']) == n_replicas * n_shards
+
+
+def test_gateways_get_different_monitoring_ports():
+    monitoring_ports = {
+        DummyGateway().runtime_args.port_monitoring[0] for _ in range(3)
+    }
+    assert len(monitoring_ports) > 1
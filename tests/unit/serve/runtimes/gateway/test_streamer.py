@@ -0,0 +1,161 @@
+import asyncio
+import json
+
+import pytest
+from docarray import Document, DocumentArray
+
+from jina.excepts import ExecutorError
+from jina.proto import jina_pb2
+from jina.serve.runtimes.gateway import streamer as streamer_module
+from jina.serve.runtimes.gateway.streamer import GatewayStreamer, _ExecutorStreamer
+
+
+def _create_streamer():
+    return GatewayStreamer(
+        graph_representation={
+            'start-gateway': ['executor0'],
+            'executor0': ['end-gateway'],
+        },
+        executor_addresses={'executor0': ['0.0.0.0:12345']},
+    )
+
+
+def _patch_rpc_stream(streamer, sent_requests):
+    async def _rpc_stream(request_iterator, **kwargs):
+        for req in request_iterator:
+            sent_requests.append(req)
+            yield req
+
+    streamer.rpc_stream = _rpc_stream
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('return_results', [True, False])
+async def test_stream_docs_requests(return_results):
+    streamer = _create_streamer()
+    sent_requests = []
+    _patch_rpc_stream(streamer, sent_requests)
+    docs = DocumentArray([Document(text=f'text {i}') for i in range(10)])
+
+    results = [
+        result
+        async for result in streamer.stream_docs(
+            docs,
+            request_size=3,
+            return_results=return_results,
+            exec_endpoint='/foo',
+            target_executor='executor0',
+            parameters={'key': 'value'},
+        )
+    ]
+
+    assert len(results) == 4
+    assert len(sent_requests) == 4
+    assert len({req.header.request_id for req in sent_requests}) == 4
+    for req in sent_requests:
+        assert req.header.exec_endpoint == '/foo'
+        assert req.header.target_executor == 'executor0'
+        assert req.parameters == {'key': 'value'}
+    assert [len(req.docs) for req in sent_requests] == [3, 3, 3, 1]
+    assert [doc.text for req in sent_requests for doc in req.docs] == docs.texts
+
+    await streamer.close()
+
+
+@pytest.mark.asyncio
+async def test_stream_docs_requests_without_header():
+    streamer = _create_streamer()
+    sent_requests = []
+    _patch_rpc_stream(streamer, sent_requests)
+    docs = DocumentArray([Document(text=f'text {i}') for i in range(5)])
+
+    async for _ in streamer.stream_docs(docs, request_size=5):
+        pass
+
+    assert len(sent_requests) == 1
+    req = sent_requests[0]
+    assert req.header.exec_endpoint == ''
+    assert req.header.target_executor == ''
+    assert req.parameters == {}
+    assert req.docs.texts == docs.texts
+
+    await streamer.close()
+
+
+@pytest.mark.asyncio
+async def test_stream_unpacks_executor_error():
+    streamer = _create_streamer()
+
+    async def _rpc_stream(request_iterator, **kwargs):
+        for i, req in enumerate(request_iterator):
+            if i == 1:
+                req.header.status.code = jina_pb2.StatusProto.ERROR
+                req.header.status.exception.name = 'ValueError'
+                req.header.status.exception.executor = 'executor0'
+            yield req
+
+    streamer.rpc_stream = _rpc_stream
+    docs = DocumentArray([Document(text=f'text {i}') for i in range(4)])
+
+    errors = [error async for _, error in streamer.stream(docs, request_size=2)]
+
+    assert errors[0] is None
+    assert isinstance(errors[1], ExecutorError)
+    assert errors[1].name == 'ValueError'
+    assert errors[1].executor == 'executor0'
+
+    await streamer.close()
+
+
+class _EchoConnectionPool:
+    def __init__(self):
+        self.sent_requests = []
+
+    def send_requests_once(self, requests, deployment, head, endpoint):
+        async def _echo():
+            return requests[0], None
+
+        self.sent_requests.extend(requests)
+        return asyncio.create_task(_echo())
+
+
+@pytest.mark.asyncio
+async def test_executor_streamer_post():
+    connection_pool = _EchoConnectionPool()
+    executor_streamer = _ExecutorStreamer(connection_pool, executor_name='executor0')
+    docs = DocumentArray([Document(text=f'text {i}') for i in range(10)])
+
+    result = await executor_streamer.post(
+        docs, request_size=4, on='/foo', parameters={'key': 'value'}
+    )
+
+    assert [len(req.docs) for req in connection_pool.sent_requests] == [4, 4, 2]
+    for req in connection_pool.sent_requests:
+        assert req.header.exec_endpoint == '/foo'
+        assert req.header.target_executor == 'executor0'
+        assert req.parameters == {'key': 'value'}
+    assert result.texts == docs.texts
+
+
+@pytest.mark.asyncio
+async def test_get_streamer_is_cached(monkeypatch):
+    streamer_args = {
+        'graph_representation': {
+            'start-gateway': ['executor0'],
+            'executor0': ['end-gateway'],
+        },
+        'executor_addresses': {'executor0': ['0.0.0.0:12345']},
+    }
+    monkeypatch.setattr(streamer_module, '_STREAMER_CACHE', {})
+    monkeypatch.setenv('JINA_STREAMER_ARGS', json.dumps(streamer_args))
+    streamer = GatewayStreamer.get_streamer()
+    assert GatewayStreamer.get_streamer() is streamer
+
+    streamer_args['executor_addresses'] = {'executor0': ['0.0.0.0:12346']}
+    monkeypatch.setenv('JINA_STREAMER_ARGS', json.dumps(streamer_args))
+    other_streamer = GatewayStreamer.get_streamer()
+    assert other_streamer is not streamer
+    assert len(streamer_module._STREAMER_CACHE) == 2
+
+    await streamer.close()
+    await other_streamer.close()
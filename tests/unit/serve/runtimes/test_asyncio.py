@@ -0,0 +1,122 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+
+import pytest
+
+from jina.serve.runtimes.asyncio import AsyncNewLoopRuntime
+
+
+class _DummyRuntime(AsyncNewLoopRuntime):
+    def __init__(self, cancel_event):
+        # skip the full runtime setup, only the cancel handling is under test
+        self.is_cancel = cancel_event
+        self.cancelled = False
+
+    async def async_run_forever(self):
+        pass
+
+    async def async_cancel(self):
+        self.cancelled = True
+
+
+def _new_threads(threads_before):
+    return [t for t in threading.enumerate() if t not in threads_before]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('event_cls', [threading.Event, multiprocessing.Event])
+async def test_wait_for_cancel_sync_event(event_cls):
+    runtime = _DummyRuntime(event_cls())
+    threading.Timer(0.1, runtime.is_cancel.set).start()
+
+    start = time.monotonic()
+    await asyncio.wait_for(runtime._wait_for_cancel(), timeout=5)
+
+    assert time.monotonic() - start < 1
+    assert runtime.cancelled
+
+
+def test_wait_for_sync_event_cancelled(monkeypatch):
+    thread_errors = []
+    monkeypatch.setattr(threading, 'excepthook', thread_errors.append)
+    threads_before = threading.enumerate()
+    event = threading.Event()
+    runtime = _DummyRuntime(event)
+    loop = asyncio.new_event_loop()
+    task = loop.create_task(runtime._wait_for_sync_event(event))
+    loop.run_until_complete(asyncio.sleep(0.05))
+    waiting_threads = _new_threads(threads_before)
+    assert len(waiting_threads) == 1
+
+    task.cancel()
+    loop.run_until_complete(asyncio.gather(task, return_exceptions=True))
+    loop.close()
+    event.set()
+
+    waiting_threads[0].join(timeout=5)
+    assert not waiting_threads[0].is_alive()
+    assert not thread_errors
+
+
+def test_wait_for_sync_event_set_after_loop_closed(monkeypatch):
+    thread_errors = []
+    monkeypatch.setattr(threading, 'excepthook', thread_errors.append)
+    threads_before = threading.enumerate()
+    event = threading.Event()
+    runtime = _DummyRuntime(event)
+    loop = asyncio.new_event_loop()
+    loop.create_task(runtime._wait_for_sync_event(event))
+    loop.run_until_complete(asyncio.sleep(0.05))
+    waiting_threads = _new_threads(threads_before)
+    assert len(waiting_threads) == 1
+
+    loop.close()
+    event.set()
+
+    waiting_threads[0].join(timeout=5)
+    assert not waiting_threads[0].is_alive()
+    assert not thread_errors
+
+
+def _patch_is_ready(monkeypatch, probe_times):
+    def _is_ready(ctrl_address, **kwargs):
+        probe_times.append(time.monotonic())
+        return False
+
+    monkeypatch.setattr(_DummyRuntime, 'is_ready', staticmethod(_is_ready))
+
+
+def test_wait_for_ready_or_shutdown_returns_once_event_is_set(monkeypatch):
+    probe_times = []
+    _patch_is_ready(monkeypatch, probe_times)
+    event = threading.Event()
+    threading.Timer(0.4, event.set).start()
+
+    start = time.monotonic()
+    assert _DummyRuntime.wait_for_ready_or_shutdown(
+        timeout=None, ready_or_shutdown_event=event, ctrl_address='0.0.0.0:12345'
+    )
+
+    # the pending wait is interrupted, the full 200ms backoff interval is not slept through
+    assert time.monotonic() - start < 0.48
+    # probes back off from 10ms to 200ms instead of polling at a fixed short interval
+    assert 4 <= len(probe_times) <= 10
+    gaps = [later - earlier for earlier, later in zip(probe_times, probe_times[1:])]
+    assert gaps[0] < 0.1
+    assert max(gaps) >= 0.15
+
+
+def test_wait_for_ready_or_shutdown_timeout(monkeypatch):
+    probe_times = []
+    _patch_is_ready(monkeypatch, probe_times)
+
+    start = time.monotonic()
+    assert not _DummyRuntime.wait_for_ready_or_shutdown(
+        timeout=0.3,
+        ready_or_shutdown_event=threading.Event(),
+        ctrl_address='0.0.0.0:12345',
+    )
+
+    assert 0.3 <= time.monotonic() - start < 0.5